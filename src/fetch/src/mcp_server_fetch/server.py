@@ -3,6 +3,7 @@ from urllib.parse import urlparse, urlunparse
 
 import markdownify
 import readabilipy.simple_json
+from httpx import AsyncClient, HTTPError
 from mcp.shared.exceptions import McpError
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -62,35 +63,34 @@ def get_robots_txt_url(url: str) -> str:
     return robots_url
 
 
-async def check_may_autonomously_fetch_url(url: str, user_agent: str) -> None:
+async def check_may_autonomously_fetch_url(
+    client: AsyncClient, url: str, user_agent: str
+) -> None:
     """
     Check if the URL can be fetched by the user agent according to the robots.txt file.
     Raises a McpError if not.
     """
-    from httpx import AsyncClient, HTTPError
-
     robot_txt_url = get_robots_txt_url(url)
 
-    async with AsyncClient() as client:
-        try:
-            response = await client.get(
-                robot_txt_url,
-                follow_redirects=True,
-                headers={"User-Agent": user_agent},
-            )
-        except HTTPError:
-            raise McpError(
-                INTERNAL_ERROR,
-                f"Failed to fetch robots.txt {robot_txt_url} due to a connection issue",
-            )
-        if response.status_code in (401, 403):
-            raise McpError(
-                INTERNAL_ERROR,
-                f"When fetching robots.txt ({robot_txt_url}), received status {response.status_code} so assuming that autonomous fetching is not allowed, the user can try manually fetching by using the fetch prompt",
-            )
-        elif 400 <= response.status_code < 500:
-            return
-        robot_txt = response.text
+    try:
+        response = await client.get(
+            robot_txt_url,
+            follow_redirects=True,
+            headers={"User-Agent": user_agent},
+        )
+    except HTTPError:
+        raise McpError(
+            INTERNAL_ERROR,
+            f"Failed to fetch robots.txt {robot_txt_url} due to a connection issue",
+        )
+    if response.status_code in (401, 403):
+        raise McpError(
+            INTERNAL_ERROR,
+            f"When fetching robots.txt ({robot_txt_url}), received status {response.status_code} so assuming that autonomous fetching is not allowed, the user can try manually fetching by using the fetch prompt",
+        )
+    elif 400 <= response.status_code < 500:
+        return
+    robot_txt = response.text
     processed_robot_txt = "\n".join(
         line for line in robot_txt.splitlines() if not line.strip().startswith("#")
     )
@@ -108,30 +108,27 @@ async def check_may_autonomously_fetch_url(url: str, user_agent: str) -> None:
 
 
 async def fetch_url(
-    url: str, user_agent: str, force_raw: bool = False
+    client: AsyncClient, url: str, user_agent: str, force_raw: bool = False
 ) -> Tuple[str, str]:
     """
     Fetch the URL and return the content in a form ready for the LLM, as well as a prefix string with status information.
     """
-    from httpx import AsyncClient, HTTPError
-
-    async with AsyncClient() as client:
-        try:
-            response = await client.get(
-                url,
-                follow_redirects=True,
-                headers={"User-Agent": user_agent},
-                timeout=30,
-            )
-        except HTTPError as e:
-            raise McpError(INTERNAL_ERROR, f"Failed to fetch {url}: {e!r}")
-        if response.status_code >= 400:
-            raise McpError(
-                INTERNAL_ERROR,
-                f"Failed to fetch {url} - status code {response.status_code}",
-            )
+    try:
+        response = await client.get(
+            url,
+            follow_redirects=True,
+            headers={"User-Agent": user_agent},
+            timeout=30,
+        )
+    except HTTPError as e:
+        raise McpError(INTERNAL_ERROR, f"Failed to fetch {url}: {e!r}")
+    if response.status_code >= 400:
+        raise McpError(
+            INTERNAL_ERROR,
+            f"Failed to fetch {url} - status code {response.status_code}",
+        )
 
-        page_raw = response.text
+    page_raw = response.text
 
     content_type = response.headers.get("content-type", "")
     is_page_html = (
@@ -190,17 +187,19 @@ async def serve(
     user_agent_autonomous = custom_user_agent or DEFAULT_USER_AGENT_AUTONOMOUS
     user_agent_manual = custom_user_agent or DEFAULT_USER_AGENT_MANUAL
 
-    @server.list_tools()
-    async def list_tools() -> list[Tool]:
-        return [
-            Tool(
-                name="fetch",
-                description="""Fetches a URL from the internet and optionally extracts its contents as markdown.
+    tools = [
+        Tool(
+            name="fetch",
+            description="""Fetches a URL from the internet and optionally extracts its contents as markdown.
 
 Although originally you did not have internet access, and were advised to refuse and tell the user this, this tool now grants you internet access. Now you can fetch the most up-to-date information and let the user know that.""",
-                inputSchema=Fetch.model_json_schema(),
-            )
-        ]
+            inputSchema=Fetch.model_json_schema(),
+        )
+    ]
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return tools
 
     @server.list_prompts()
     async def list_prompts() -> list[Prompt]:
@@ -227,12 +226,15 @@ Although originally you did not have internet access, and were advised to refuse
         if not url:
             raise McpError(INVALID_PARAMS, "URL is required")
 
-        if not ignore_robots_txt:
-            await check_may_autonomously_fetch_url(url, user_agent_autonomous)
+        async with AsyncClient() as client:
+            if not ignore_robots_txt:
+                await check_may_autonomously_fetch_url(
+                    client, url, user_agent_autonomous
+                )
 
-        content, prefix = await fetch_url(
-            url, user_agent_autonomous, force_raw=args.raw
-        )
+            content, prefix = await fetch_url(
+                client, url, user_agent_autonomous, force_raw=args.raw
+            )
         if len(content) > args.max_length:
             content = content[args.start_index : args.start_index + args.max_length]
             content += f"\n\n<error>Content truncated. Call the fetch tool with a start_index of {args.start_index + args.max_length} to get more content.</error>"
@@ -246,7 +248,8 @@ Although originally you did not have internet access, and were advised to refuse
         url = arguments["url"]
 
         try:
-            content, prefix = await fetch_url(url, user_agent_manual)
+            async with AsyncClient() as client:
+                content, prefix = await fetch_url(client, url, user_agent_manual)
             # TODO: after SDK bug is addressed, don't catch the exception
         except McpError as e:
             return GetPromptResult(
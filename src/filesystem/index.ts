@@ -185,6 +185,7 @@ async function searchFiles(
   pattern: string,
 ): Promise<string[]> {
   const results: string[] = [];
+  const lowerPattern = pattern.toLowerCase();
 
   async function search(currentPath: string) {
     const entries = await fs.readdir(currentPath, { withFileTypes: true });
@@ -196,7 +197,7 @@ async function searchFiles(
         // Validate each path before processing
         await validatePath(fullPath);
 
-        if (entry.name.toLowerCase().includes(pattern.toLowerCase())) {
+        if (entry.name.toLowerCase().includes(lowerPattern)) {
           results.push(fullPath);
         }
 
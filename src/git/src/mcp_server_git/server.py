@@ -76,16 +76,13 @@ def git_reset(repo: git.Repo) -> str:
     return "All staged changes reset"
 
 def git_log(repo: git.Repo, max_count: int = 10) -> list[str]:
-    commits = list(repo.iter_commits(max_count=max_count))
-    log = []
-    for commit in commits:
-        log.append(
-            f"Commit: {commit.hexsha}\n"
-            f"Author: {commit.author}\n"
-            f"Date: {commit.authored_datetime}\n"
-            f"Message: {commit.message}\n"
-        )
-    return log
+    return [
+        f"Commit: {commit.hexsha}\n"
+        f"Author: {commit.author}\n"
+        f"Date: {commit.authored_datetime}\n"
+        f"Message: {commit.message}\n"
+        for commit in repo.iter_commits(max_count=max_count)
+    ]
 
 def git_create_branch(repo: git.Repo, branch_name: str, base_branch: str | None = None) -> str:
     if base_branch:
@@ -109,50 +106,52 @@ async def serve(repository: Path | None) -> None:
 
     server = Server("mcp-git")
 
+    tools = [
+        Tool(
+            name=GitTools.STATUS,
+            description="Shows the working tree status",
+            inputSchema=GitStatus.schema(),
+        ),
+        Tool(
+            name=GitTools.DIFF_UNSTAGED,
+            description="Shows changes in the working directory that are not yet staged",
+            inputSchema=GitDiffUnstaged.schema(),
+        ),
+        Tool(
+            name=GitTools.DIFF_STAGED,
+            description="Shows changes that are staged for commit",
+            inputSchema=GitDiffStaged.schema(),
+        ),
+        Tool(
+            name=GitTools.COMMIT,
+            description="Records changes to the repository",
+            inputSchema=GitCommit.schema(),
+        ),
+        Tool(
+            name=GitTools.ADD,
+            description="Adds file contents to the staging area",
+            inputSchema=GitAdd.schema(),
+        ),
+        Tool(
+            name=GitTools.RESET,
+            description="Unstages all staged changes",
+            inputSchema=GitReset.schema(),
+        ),
+        Tool(
+            name=GitTools.LOG,
+            description="Shows the commit logs",
+            inputSchema=GitLog.schema(),
+        ),
+        Tool(
+            name=GitTools.CREATE_BRANCH,
+            description="Creates a new branch from an optional base branch",
+            inputSchema=GitCreateBranch.schema(),
+        ),
+    ]
+
     @server.list_tools()
     async def list_tools() -> list[Tool]:
-        return [
-            Tool(
-                name=GitTools.STATUS,
-                description="Shows the working tree status",
-                inputSchema=GitStatus.schema(),
-            ),
-            Tool(
-                name=GitTools.DIFF_UNSTAGED,
-                description="Shows changes in the working directory that are not yet staged",
-                inputSchema=GitDiffUnstaged.schema(),
-            ),
-            Tool(
-                name=GitTools.DIFF_STAGED,
-                description="Shows changes that are staged for commit",
-                inputSchema=GitDiffStaged.schema(),
-            ),
-            Tool(
-                name=GitTools.COMMIT,
-                description="Records changes to the repository",
-                inputSchema=GitCommit.schema(),
-            ),
-            Tool(
-                name=GitTools.ADD,
-                description="Adds file contents to the staging area",
-                inputSchema=GitAdd.schema(),
-            ),
-            Tool(
-                name=GitTools.RESET,
-                description="Unstages all staged changes",
-                inputSchema=GitReset.schema(),
-            ),
-            Tool(
-                name=GitTools.LOG,
-                description="Shows the commit logs",
-                inputSchema=GitLog.schema(),
-            ),
-            Tool(
-                name=GitTools.CREATE_BRANCH,
-                description="Creates a new branch from an optional base branch",
-                inputSchema=GitCreateBranch.schema(),
-            ),
-        ]
+        return tools
 
     async def list_repos() -> Sequence[str]:
         async def by_roots() -> Sequence[str]:
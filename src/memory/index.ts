@@ -33,19 +33,43 @@ interface KnowledgeGraph {
   relations: Relation[];
 }
 
+// Relations have no id of their own, so identify them by all three fields
+function relationKey(relation: Relation): string {
+  return JSON.stringify([relation.from, relation.to, relation.relationType]);
+}
+
+// Older memory files can hold duplicate names; keep the first, as a find() over the list would
+function indexEntitiesByName(entities: Entity[]): Map<string, Entity> {
+  const byName = new Map<string, Entity>();
+  for (const e of entities) {
+    if (!byName.has(e.name)) byName.set(e.name, e);
+  }
+  return byName;
+}
+
 // The KnowledgeGraphManager class contains all operations to interact with the knowledge graph
 class KnowledgeGraphManager {
+  // The last graph read from or written to disk, reused until the file changes underneath us
+  private cache: { graph: KnowledgeGraph; mtimeMs: number; size: number } | null = null;
+
   private async loadGraph(): Promise<KnowledgeGraph> {
     try {
+      const stats = await fs.stat(MEMORY_FILE_PATH);
+      if (this.cache && this.cache.mtimeMs === stats.mtimeMs && this.cache.size === stats.size) {
+        return this.cache.graph;
+      }
       const data = await fs.readFile(MEMORY_FILE_PATH, "utf-8");
       const lines = data.split("\n").filter(line => line.trim() !== "");
-      return lines.reduce((graph: KnowledgeGraph, line) => {
+      const graph: KnowledgeGraph = lines.reduce((graph: KnowledgeGraph, line) => {
         const item = JSON.parse(line);
         if (item.type === "entity") graph.entities.push(item as Entity);
         if (item.type === "relation") graph.relations.push(item as Relation);
         return graph;
       }, { entities: [], relations: [] });
+      this.cache = { graph, mtimeMs: stats.mtimeMs, size: stats.size };
+      return graph;
     } catch (error) {
+      this.cache = null;
       if (error instanceof Error && 'code' in error && (error as any).code === "ENOENT") {
         return { entities: [], relations: [] };
       }
@@ -58,12 +82,20 @@ class KnowledgeGraphManager {
       ...graph.entities.map(e => JSON.stringify({ type: "entity", ...e })),
       ...graph.relations.map(r => JSON.stringify({ type: "relation", ...r })),
     ];
+    this.cache = null;
     await fs.writeFile(MEMORY_FILE_PATH, lines.join("\n"));
+    const stats = await fs.stat(MEMORY_FILE_PATH);
+    this.cache = { graph, mtimeMs: stats.mtimeMs, size: stats.size };
   }
 
   async createEntities(entities: Entity[]): Promise<Entity[]> {
     const graph = await this.loadGraph();
-    const newEntities = entities.filter(e => !graph.entities.some(existingEntity => existingEntity.name === e.name));
+    const existingNames = new Set(graph.entities.map(e => e.name));
+    const newEntities = entities.filter(e => {
+      if (existingNames.has(e.name)) return false;
+      existingNames.add(e.name);
+      return true;
+    });
     graph.entities.push(...newEntities);
     await this.saveGraph(graph);
     return newEntities;
@@ -71,11 +103,13 @@ class KnowledgeGraphManager {
 
   async createRelations(relations: Relation[]): Promise<Relation[]> {
     const graph = await this.loadGraph();
-    const newRelations = relations.filter(r => !graph.relations.some(existingRelation => 
-      existingRelation.from === r.from && 
-      existingRelation.to === r.to && 
-      existingRelation.relationType === r.relationType
-    ));
+    const existingKeys = new Set(graph.relations.map(relationKey));
+    const newRelations = relations.filter(r => {
+      const key = relationKey(r);
+      if (existingKeys.has(key)) return false;
+      existingKeys.add(key);
+      return true;
+    });
     graph.relations.push(...newRelations);
     await this.saveGraph(graph);
     return newRelations;
@@ -83,12 +117,23 @@ class KnowledgeGraphManager {
 
   async addObservations(observations: { entityName: string; contents: string[] }[]): Promise<{ entityName: string; addedObservations: string[] }[]> {
     const graph = await this.loadGraph();
-    const results = observations.map(o => {
-      const entity = graph.entities.find(e => e.name === o.entityName);
+    const entitiesByName = indexEntitiesByName(graph.entities);
+    // Resolve every entity before mutating anything, so a missing name cannot leave the cached graph half-updated
+    const entities = observations.map(o => {
+      const entity = entitiesByName.get(o.entityName);
       if (!entity) {
         throw new Error(`Entity with name ${o.entityName} not found`);
       }
-      const newObservations = o.contents.filter(content => !entity.observations.includes(content));
+      return entity;
+    });
+    const results = observations.map((o, i) => {
+      const entity = entities[i];
+      const existingObservations = new Set(entity.observations);
+      const newObservations = o.contents.filter(content => {
+        if (existingObservations.has(content)) return false;
+        existingObservations.add(content);
+        return true;
+      });
       entity.observations.push(...newObservations);
       return { entityName: o.entityName, addedObservations: newObservations };
     });
@@ -98,17 +143,20 @@ class KnowledgeGraphManager {
 
   async deleteEntities(entityNames: string[]): Promise<void> {
     const graph = await this.loadGraph();
-    graph.entities = graph.entities.filter(e => !entityNames.includes(e.name));
-    graph.relations = graph.relations.filter(r => !entityNames.includes(r.from) && !entityNames.includes(r.to));
+    const toDelete = new Set(entityNames);
+    graph.entities = graph.entities.filter(e => !toDelete.has(e.name));
+    graph.relations = graph.relations.filter(r => !toDelete.has(r.from) && !toDelete.has(r.to));
     await this.saveGraph(graph);
   }
 
   async deleteObservations(deletions: { entityName: string; observations: string[] }[]): Promise<void> {
     const graph = await this.loadGraph();
+    const entitiesByName = indexEntitiesByName(graph.entities);
     deletions.forEach(d => {
-      const entity = graph.entities.find(e => e.name === d.entityName);
+      const entity = entitiesByName.get(d.entityName);
       if (entity) {
-        entity.observations = entity.observations.filter(o => !d.observations.includes(o));
+        const toDelete = new Set(d.observations);
+        entity.observations = entity.observations.filter(o => !toDelete.has(o));
       }
     });
     await this.saveGraph(graph);
@@ -116,11 +164,8 @@ class KnowledgeGraphManager {
 
   async deleteRelations(relations: Relation[]): Promise<void> {
     const graph = await this.loadGraph();
-    graph.relations = graph.relations.filter(r => !relations.some(delRelation => 
-      r.from === delRelation.from && 
-      r.to === delRelation.to && 
-      r.relationType === delRelation.relationType
-    ));
+    const toDelete = new Set(relations.map(relationKey));
+    graph.relations = graph.relations.filter(r => !toDelete.has(relationKey(r)));
     await this.saveGraph(graph);
   }
 
@@ -131,12 +176,13 @@ class KnowledgeGraphManager {
   // Very basic search function
   async searchNodes(query: string): Promise<KnowledgeGraph> {
     const graph = await this.loadGraph();
+    const lowerQuery = query.toLowerCase();
     
     // Filter entities
     const filteredEntities = graph.entities.filter(e => 
-      e.name.toLowerCase().includes(query.toLowerCase()) ||
-      e.entityType.toLowerCase().includes(query.toLowerCase()) ||
-      e.observations.some(o => o.toLowerCase().includes(query.toLowerCase()))
+      e.name.toLowerCase().includes(lowerQuery) ||
+      e.entityType.toLowerCase().includes(lowerQuery) ||
+      e.observations.some(o => o.toLowerCase().includes(lowerQuery))
     );
   
     // Create a Set of filtered entity names for quick lookup
@@ -159,7 +205,8 @@ class KnowledgeGraphManager {
     const graph = await this.loadGraph();
     
     // Filter entities
-    const filteredEntities = graph.entities.filter(e => names.includes(e.name));
+    const requestedNames = new Set(names);
+    const filteredEntities = graph.entities.filter(e => requestedNames.has(e.name));
   
     // Create a Set of filtered entity names for quick lookup
     const filteredEntityNames = new Set(filteredEntities.map(e => e.name));
@@ -377,11 +424,11 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
 
   switch (name) {
     case "create_entities":
-      return { content: [{ type: "text", text: JSON.stringify(await knowledgeGraphManager.createEntities(args.entities as Entity[]), null, 2) }] };
+      return { content: [{ type: "text", text: JSON.stringify(await knowledgeGraphManager.createEntities(args.entities as Entity[])) }] };
     case "create_relations":
-      return { content: [{ type: "text", text: JSON.stringify(await knowledgeGraphManager.createRelations(args.relations as Relation[]), null, 2) }] };
+      return { content: [{ type: "text", text: JSON.stringify(await knowledgeGraphManager.createRelations(args.relations as Relation[])) }] };
     case "add_observations":
-      return { content: [{ type: "text", text: JSON.stringify(await knowledgeGraphManager.addObservations(args.observations as { entityName: string; contents: string[] }[]), null, 2) }] };
+      return { content: [{ type: "text", text: JSON.stringify(await knowledgeGraphManager.addObservations(args.observations as { entityName: string; contents: string[] }[])) }] };
     case "delete_entities":
       await knowledgeGraphManager.deleteEntities(args.entityNames as string[]);
       return { content: [{ type: "text", text: "Entities deleted successfully" }] };
@@ -392,11 +439,11 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
       await knowledgeGraphManager.deleteRelations(args.relations as Relation[]);
       return { content: [{ type: "text", text: "Relations deleted successfully" }] };
     case "read_graph":
-      return { content: [{ type: "text", text: JSON.stringify(await knowledgeGraphManager.readGraph(), null, 2) }] };
+      return { content: [{ type: "text", text: JSON.stringify(await knowledgeGraphManager.readGraph()) }] };
     case "search_nodes":
-      return { content: [{ type: "text", text: JSON.stringify(await knowledgeGraphManager.searchNodes(args.query as string), null, 2) }] };
+      return { content: [{ type: "text", text: JSON.stringify(await knowledgeGraphManager.searchNodes(args.query as string)) }] };
     case "open_nodes":
-      return { content: [{ type: "text", text: JSON.stringify(await knowledgeGraphManager.openNodes(args.names as string[]), null, 2) }] };
+      return { content: [{ type: "text", text: JSON.stringify(await knowledgeGraphManager.openNodes(args.names as string[])) }] };
     default:
       throw new Error(`Unknown tool: ${name}`);
   }
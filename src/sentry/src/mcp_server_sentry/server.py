@@ -117,24 +117,24 @@ def create_stacktrace(latest_event: dict) -> str:
             exception_value = exception.get("value", "")
             stacktrace = exception.get("stacktrace")
 
-            stacktrace_text = f"Exception: {exception_type}: {exception_value}\n\n"
+            parts = [f"Exception: {exception_type}: {exception_value}\n\n"]
             if stacktrace:
-                stacktrace_text += "Stacktrace:\n"
+                parts.append("Stacktrace:\n")
                 for frame in stacktrace.get("frames", []):
                     filename = frame.get("filename", "Unknown")
                     lineno = frame.get("lineNo", "?")
                     function = frame.get("function", "Unknown")
 
-                    stacktrace_text += f"{filename}:{lineno} in {function}\n"
+                    parts.append(f"{filename}:{lineno} in {function}\n")
 
                     if "context" in frame:
                         context = frame["context"]
                         for ctx_line in context:
-                            stacktrace_text += f"    {ctx_line[1]}\n"
+                            parts.append(f"    {ctx_line[1]}\n")
 
-                    stacktrace_text += "\n"
+                    parts.append("\n")
 
-            stacktraces.append(stacktrace_text)
+            stacktraces.append("".join(parts))
 
     return "\n".join(stacktraces) if stacktraces else "No stacktrace found"
 
@@ -144,22 +144,27 @@ async def handle_sentry_issue(
 ) -> SentryIssueData:
     try:
         issue_id = extract_issue_id(issue_id_or_url)
+        headers = {"Authorization": f"Bearer {auth_token}"}
 
-        response = await http_client.get(
-            f"issues/{issue_id}/", headers={"Authorization": f"Bearer {auth_token}"}
+        # The issue and its hashes are independent lookups, so fetch them concurrently
+        hashes_task = asyncio.create_task(
+            http_client.get(f"issues/{issue_id}/hashes/", headers=headers)
         )
-        if response.status_code == 401:
-            raise McpError(
-                "Error: Unauthorized. Please check your MCP_SENTRY_AUTH_TOKEN token."
-            )
-        response.raise_for_status()
-        issue_data = response.json()
+        try:
+            response = await http_client.get(f"issues/{issue_id}/", headers=headers)
+            if response.status_code == 401:
+                raise McpError(
+                    "Error: Unauthorized. Please check your MCP_SENTRY_AUTH_TOKEN token."
+                )
+            response.raise_for_status()
+            issue_data = response.json()
+
+            hashes_response = await hashes_task
+        except BaseException:
+            hashes_task.cancel()
+            await asyncio.gather(hashes_task, return_exceptions=True)
+            raise
 
-        # Get issue hashes
-        hashes_response = await http_client.get(
-            f"issues/{issue_id}/hashes/",
-            headers={"Authorization": f"Bearer {auth_token}"},
-        )
         hashes_response.raise_for_status()
         hashes = hashes_response.json()
 
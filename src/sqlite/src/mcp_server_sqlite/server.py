@@ -1,3 +1,4 @@
+import re
 import sqlite3
 import logging
 from contextlib import closing
@@ -12,6 +13,10 @@ from typing import Any
 logger = logging.getLogger('mcp_sqlite_server')
 logger.info("Starting MCP SQLite Server")
 
+# Statement classifiers, matched against the start of the query without copying or upper-casing it
+SELECT_QUERY_PATTERN = re.compile(r"\s*SELECT", re.IGNORECASE)
+CREATE_TABLE_PATTERN = re.compile(r"\s*CREATE TABLE", re.IGNORECASE)
+
 PROMPT_TEMPLATE = """
 The assistants goal is to walkthrough an informative demo of MCP. To demonstrate the Model Context Protocol (MCP) we will leverage this example server to interact with an SQLite database.
 It is important that you first explain to the user what is going on. The user has downloaded and installed the SQLite MCP Server and is now ready to use it.
@@ -101,11 +106,10 @@ class SqliteDatabase:
         self.insights: list[str] = []
 
     def _init_database(self):
-        """Initialize connection to the SQLite database"""
+        """Open the connection to the SQLite database that every query reuses"""
         logger.debug("Initializing database connection")
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            conn.row_factory = sqlite3.Row
-            conn.close()
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
 
     def _synthesize_memo(self) -> str:
         """Synthesizes business insights into a formatted memo"""
@@ -130,24 +134,28 @@ class SqliteDatabase:
         """Execute a SQL query and return results as a list of dictionaries"""
         logger.debug(f"Executing query: {query}")
         try:
-            with closing(sqlite3.connect(self.db_path)) as conn:
-                conn.row_factory = sqlite3.Row
-                with closing(conn.cursor()) as cursor:
-                    if params:
-                        cursor.execute(query, params)
-                    else:
-                        cursor.execute(query)
-
-                    if query.strip().upper().startswith(('INSERT', 'UPDATE', 'DELETE', 'CREATE', 'DROP', 'ALTER')):
-                        conn.commit()
-                        affected = cursor.rowcount
-                        logger.debug(f"Write query affected {affected} rows")
-                        return [{"affected_rows": affected}]
-
-                    results = [dict(row) for row in cursor.fetchall()]
-                    logger.debug(f"Read query returned {len(results)} rows")
-                    return results
+            with closing(self.conn.cursor()) as cursor:
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+
+                # Commit on connection state, not query text: REPLACE, WITH ... INSERT, etc. also open transactions
+                if cursor.description is None:
+                    if self.conn.in_transaction:
+                        self.conn.commit()
+                    affected = cursor.rowcount
+                    logger.debug(f"Write query affected {affected} rows")
+                    return [{"affected_rows": affected}]
+
+                results = [dict(row) for row in cursor]
+                if self.conn.in_transaction:
+                    self.conn.commit()
+                logger.debug(f"Read query returned {len(results)} rows")
+                return results
         except Exception as e:
+            # Don't leave a failed write's transaction open on the shared connection
+            self.conn.rollback()
             logger.error(f"Database error executing query: {e}")
             raise
 
@@ -322,7 +330,6 @@ async def main(db_path: str):
                     raise ValueError("Missing insight argument")
 
                 db.insights.append(arguments["insight"])
-                _ = db._synthesize_memo()
 
                 # Notify clients that the memo resource has changed
                 await server.request_context.session.send_resource_updated(AnyUrl("memo://insights"))
@@ -333,19 +340,19 @@ async def main(db_path: str):
                 raise ValueError("Missing arguments")
 
             if name == "read-query":
-                if not arguments["query"].strip().upper().startswith("SELECT"):
+                if not SELECT_QUERY_PATTERN.match(arguments["query"]):
                     raise ValueError("Only SELECT queries are allowed for read-query")
                 results = db._execute_query(arguments["query"])
                 return [types.TextContent(type="text", text=str(results))]
 
             elif name == "write-query":
-                if arguments["query"].strip().upper().startswith("SELECT"):
+                if SELECT_QUERY_PATTERN.match(arguments["query"]):
                     raise ValueError("SELECT queries are not allowed for write-query")
                 results = db._execute_query(arguments["query"])
                 return [types.TextContent(type="text", text=str(results))]
 
             elif name == "create-table":
-                if not arguments["query"].strip().upper().startswith("CREATE TABLE"):
+                if not CREATE_TABLE_PATTERN.match(arguments["query"]):
                     raise ValueError("Only CREATE TABLE statements are allowed")
                 db._execute_query(arguments["query"])
                 return [types.TextContent(type="text", text="Table created successfully")]
@@ -0,0 +1,43 @@
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from mcp_server_sqlite.server import SqliteDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"))
+    with closing(db.conn):
+        db._execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        yield db
+
+
+def assert_other_connection_can_write(db, expected_rows):
+    with closing(sqlite3.connect(db.db_path, timeout=0)) as other:
+        assert other.execute("SELECT COUNT(*) FROM items").fetchone() == (expected_rows,)
+        other.execute("INSERT INTO items (name) VALUES ('other')")
+        other.commit()
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "REPLACE INTO items (id, name) VALUES (1, 'replaced')",
+        "WITH v(id, name) AS (VALUES (2, 'cte')) INSERT INTO items SELECT id, name FROM v",
+        "-- leading comment\nINSERT INTO items (id, name) VALUES (3, 'commented')",
+    ],
+)
+def test_write_query_is_committed(db, query):
+    result = db._execute_query(query)
+    assert "affected_rows" in result[0]
+    assert not db.conn.in_transaction
+    assert_other_connection_can_write(db, 1)
+
+
+def test_failed_write_query_is_rolled_back(db):
+    with pytest.raises(sqlite3.IntegrityError):
+        db._execute_query("INSERT INTO items (id, name) VALUES (1, 'first'), (1, 'duplicate')")
+    assert not db.conn.in_transaction
+    assert_other_connection_can_write(db, 0)
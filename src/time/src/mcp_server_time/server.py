@@ -1,3 +1,4 @@
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 import json
@@ -17,13 +18,15 @@ class TimeTools(str, Enum):
     CONVERT_TIME = "convert_time"
 
 
-class TimeResult(BaseModel):
+@dataclass
+class TimeResult:
     timezone: str
     datetime: str
     is_dst: bool
 
 
-class TimeConversionResult(BaseModel):
+@dataclass
+class TimeConversionResult:
     source: TimeResult
     target: TimeResult
     time_difference: str
@@ -53,17 +56,21 @@ def get_zoneinfo(timezone_name: str) -> ZoneInfo:
         raise McpError(f"Invalid timezone: {str(e)}")
 
 
+def make_time_result(timezone_name: str, time: datetime) -> TimeResult:
+    return TimeResult(
+        timezone=timezone_name,
+        datetime=time.isoformat(timespec="seconds"),
+        is_dst=bool(time.dst()),
+    )
+
+
 class TimeServer:
     def get_current_time(self, timezone_name: str) -> TimeResult:
         """Get current time in specified timezone"""
         timezone = get_zoneinfo(timezone_name)
         current_time = datetime.now(timezone)
 
-        return TimeResult(
-            timezone=timezone_name,
-            datetime=current_time.isoformat(timespec="seconds"),
-            is_dst=bool(current_time.dst()),
-        )
+        return make_time_result(timezone_name, current_time)
 
     def convert_time(
         self, source_tz: str, time_str: str, target_tz: str
@@ -99,16 +106,8 @@ class TimeServer:
             time_diff_str = f"{hours_difference:+.2f}".rstrip("0").rstrip(".") + "h"
 
         return TimeConversionResult(
-            source=TimeResult(
-                timezone=source_tz,
-                datetime=source_time.isoformat(timespec="seconds"),
-                is_dst=bool(source_time.dst()),
-            ),
-            target=TimeResult(
-                timezone=target_tz,
-                datetime=target_time.isoformat(timespec="seconds"),
-                is_dst=bool(target_time.dst()),
-            ),
+            source=make_time_result(source_tz, source_time),
+            target=make_time_result(target_tz, target_time),
             time_difference=time_diff_str,
         )
 
@@ -190,7 +189,7 @@ async def serve(local_timezone: str | None = None) -> None:
                     raise ValueError(f"Unknown tool: {name}")
 
             return [
-                TextContent(type="text", text=json.dumps(result.model_dump(), indent=2))
+                TextContent(type="text", text=json.dumps(asdict(result), indent=2))
             ]
 
         except Exception as e: